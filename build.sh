@@ -0,0 +1,23 @@
+#!/bin/sh
+# Precompile the library modules to MicroPython .mpy bytecode
+# Usage: ./build.sh [arch]   e.g. ./build.sh armv7m, ./build.sh xtensa
+# The arch is only needed for the @micropython.native kernels in physics_native.py;
+# without it that module is skipped and physics.py keeps its bytecode versions.
+# main.py stays as source so boards and shells can run it directly.
+set -e
+
+ARCH="$1"
+OUT=build
+
+mkdir -p "$OUT"
+
+for module in constants utils chemistry physics examples templates; do
+    mpy-cross -O3 -o "$OUT/$module.mpy" "$module.py"
+done
+
+if [ -n "$ARCH" ]; then
+    mpy-cross -O3 -march="$ARCH" -o "$OUT/physics_native.mpy" physics_native.py
+fi
+
+cp main.py "$OUT/main.py"
+echo "Built $(ls "$OUT" | wc -l) files in $OUT/"
@@ -0,0 +1,54 @@
+"""
+Desktop check that physics_native.py matches the physics.py kernels it shadows
+Stubs out micropython.native so both builds run under CPython
+Run: python check_native.py
+"""
+
+import sys
+import types
+
+# Imported before the stub exists, so physics keeps its pure-Python kernels
+import physics
+
+KERNEL_CASES = (
+    ('newtons_second_law', ((2.0, 9.8), (0.5, -3.0), (0, 1.0), (-1.0, 1.0))),
+    ('friction_force', ((0.3, 50.0), (0, 10.0), (-0.1, 5.0), (0.2, -1.0))),
+    ('kinetic_energy', ((2.0, 3.0), (1.5, -4.0), (0, 2.0), (-2.0, 1.0))),
+    ('ideal_gas_work', ((101325.0, 0.002), (5.0, -1.5), (0, 0))),
+    ('coulomb_force', ((1e-6, 2e-6, 0.1), (-3e-9, 4e-9, 2.5), (1e-6, 1e-6, 0), (1.0, 1.0, -1.0))),
+    ('electric_field', ((1e-6, 0.5), (-2e-9, 0.01), (1e-6, 0), (1e-6, -2.0))),
+)
+
+def _outcome(func, args):
+    """Return value, or the ValueError message, of one call"""
+    try:
+        return ('value', func(*args))
+    except ValueError as e:
+        return ('error', str(e))
+
+def check_native_sync():
+    """Compare every native kernel against its physics.py twin; returns mismatches"""
+    stub = types.ModuleType('micropython')
+    stub.native = lambda func: func
+    sys.modules['micropython'] = stub
+    try:
+        import physics_native
+    finally:
+        del sys.modules['micropython']
+    
+    mismatches = []
+    for name, cases in KERNEL_CASES:
+        for args in cases:
+            expected = _outcome(getattr(physics, name), args)
+            actual = _outcome(getattr(physics_native, name), args)
+            if expected != actual:
+                mismatches.append((name, args, expected, actual))
+    return mismatches
+
+if __name__ == "__main__":
+    mismatches = check_native_sync()
+    for name, args, expected, actual in mismatches:
+        print(f"{name}{args}: physics {expected} != native {actual}")
+    if mismatches:
+        sys.exit(1)
+    print(f"physics_native matches physics for {len(KERNEL_CASES)} kernels")
@@ -5,76 +5,120 @@ Optimized for memory efficiency on graphing calculators
 
 import math
 from constants import *
+# array carries the tuple fallback guarded in constants
+from constants import array, table_lookup
+from utils import lru_cache
 
-# Atomic masses dictionary (simplified for memory efficiency)
-ATOMIC_MASSES = {
-    'H': 1.008, 'He': 4.003, 'Li': 6.941, 'Be': 9.012, 'B': 10.811,
-    'C': 12.011, 'N': 14.007, 'O': 15.999, 'F': 18.998, 'Ne': 20.180,
-    'Na': 22.990, 'Mg': 24.305, 'Al': 26.982, 'Si': 28.086, 'P': 30.974,
-    'S': 32.066, 'Cl': 35.453, 'Ar': 39.948, 'K': 39.098, 'Ca': 40.078,
-    'Fe': 55.845, 'Cu': 63.546, 'Zn': 65.38, 'Br': 79.904, 'I': 126.904
-}
+# Atomic masses (simplified for memory efficiency)
+# Sorted symbols with a parallel value array instead of a dict
+ATOMIC_MASS_SYMBOLS = (
+    'Al', 'Ar', 'B', 'Be', 'Br', 'C', 'Ca', 'Cl',
+    'Cu', 'F', 'Fe', 'H', 'He', 'I', 'K', 'Li',
+    'Mg', 'N', 'Na', 'Ne', 'O', 'P', 'S', 'Si',
+    'Zn'
+)
+ATOMIC_MASS_VALUES = array('d', (
+    26.982, 39.948, 10.811, 9.012, 79.904, 12.011, 40.078, 35.453,
+    63.546, 18.998, 55.845, 1.008, 4.003, 126.904, 39.098, 6.941,
+    24.305, 14.007, 22.990, 20.180, 15.999, 30.974, 32.066, 28.086,
+    65.38
+))
 
+def atomic_mass(symbol):
+    """Atomic mass of an element in g/mol"""
+    mass = table_lookup(ATOMIC_MASS_SYMBOLS, ATOMIC_MASS_VALUES, symbol)
+    if mass is None:
+        raise ValueError(f"Unknown element: {symbol}")
+    return mass
+
+class RateCache:
+    """
+    Single-entry cache holding the last inputs and their result
+    Time-step loops with unchanged conditions skip recomputation
+    """
+    __slots__ = ('key', 'val')
+
+    def __init__(self):
+        self.key = None
+        self.val = None
+
+_RATE_CONSTANT_CACHE = RateCache()
+_ARRHENIUS_CACHE = RateCache()
+_NERNST_PREFACTOR_CACHE = RateCache()  # RT/(nF), keyed on (n, T)
+
+# [H+] for whole-number pH 0-14
+_PH_LUT = tuple(10.0**(-i) for i in range(15))
+
+# Constant factors of the quantum energy expressions
+_PLANCK_SQ = PLANCK_CONSTANT * PLANCK_CONSTANT
+_HYDROGEN_E0 = -HYDROGEN_E0_EV * ELECTRON_VOLT
+
+@lru_cache(maxsize=256)
 def molecular_weight(formula):
     """
     Calculate molecular weight from chemical formula
     Example: molecular_weight("H2O") returns 18.015
+    Results are cached per formula string
     """
     if not formula:
         raise ValueError("Formula cannot be empty")
     
     total_mass = 0
+    n = len(formula)
     i = 0
     
-    while i < len(formula):
-        # Get element symbol
-        if i + 1 < len(formula) and formula[i + 1].islower():
-            element = formula[i:i + 2]
-            i += 2
-        else:
-            element = formula[i]
+    while i < n:
+        # Element symbol: one character plus an optional lowercase letter
+        start = i
+        i += 1
+        if i < n and 'a' <= formula[i] <= 'z':
             i += 1
         
-        # Get count
-        count_str = ""
-        while i < len(formula) and formula[i].isdigit():
-            count_str += formula[i]
-            i += 1
+        mass = atomic_mass(formula[start:i])
         
-        count = int(count_str) if count_str else 1
-        
-        if element not in ATOMIC_MASSES:
-            raise ValueError(f"Unknown element: {element}")
+        # Count: run of digits sliced once, default 1
+        start = i
+        while i < n and '0' <= formula[i] <= '9':
+            i += 1
         
-        total_mass += ATOMIC_MASSES[element] * count
+        total_mass += mass * int(formula[start:i]) if i > start else mass
     
     return total_mass
 
-def ideal_gas_law(P=0, V=0, n=0, T=0):
+# Field order of the tuples returned by the *_t solvers
+IDEAL_GAS_FIELDS = ('P', 'V', 'n', 'T')
+DILUTION_FIELDS = ('C1', 'V1', 'C2', 'V2')
+
+def ideal_gas_law_t(P=0, V=0, n=0, T=0):
     """
     Ideal Gas Law: PV = nRT
     Calculate missing variable when 3 are known
-    Returns dictionary with all values
+    Returns (P, V, n, T) tuple
     """
-    known_count = sum(1 for x in [P, V, n, T] if x != 0)
+    known_count = (P != 0) + (V != 0) + (n != 0) + (T != 0)
     
     if known_count != 3:
         raise ValueError("Exactly 3 variables must be non-zero")
     
     R = GAS_CONSTANT  # 0.08206 L·atm/(mol·K)
     
-    result = {'P': P, 'V': V, 'n': n, 'T': T}
-    
-    if P == 0:
-        result['P'] = (n * R * T) / V
-    elif V == 0:
-        result['V'] = (n * R * T) / P
+    # Most common unknown first
+    if V == 0:
+        return (P, (n * R * T) / P, n, T)
+    elif P == 0:
+        return ((n * R * T) / V, V, n, T)
     elif n == 0:
-        result['n'] = (P * V) / (R * T)
-    elif T == 0:
-        result['T'] = (P * V) / (n * R)
-    
-    return result
+        return (P, V, (P * V) / (R * T), T)
+    else:
+        return (P, V, n, (P * V) / (n * R))
+
+def ideal_gas_law(P=0, V=0, n=0, T=0):
+    """
+    Ideal Gas Law: PV = nRT
+    Calculate missing variable when 3 are known
+    Returns dictionary with all values
+    """
+    return dict(zip(IDEAL_GAS_FIELDS, ideal_gas_law_t(P, V, n, T)))
 
 def calculate_ph(h_concentration):
     """
@@ -91,15 +135,19 @@ def ph_to_concentration(ph):
     Calculate H+ concentration from pH
     [H+] = 10^(-pH)
     """
-    if ph < 0 or ph > 14:
+    if (ph < 0.0) | (ph > 14.0):
         raise ValueError("pH must be between 0 and 14")
     
-    return 10**(-ph)
+    if ph % 1 == 0:
+        return _PH_LUT[int(ph)]
+    
+    return math.pow(10.0, -ph)
 
-def dilution_calculation(C1, V1, C2=0, V2=0):
+def dilution_calculation_t(C1, V1, C2=0, V2=0):
     """
     Dilution calculation: C1V1 = C2V2
     Calculate missing variable
+    Returns (C1, V1, C2, V2) tuple
     """
     if C1 <= 0 or V1 <= 0:
         raise ValueError("Initial concentration and volume must be positive")
@@ -107,14 +155,19 @@ def dilution_calculation(C1, V1, C2=0, V2=0):
     if C2 == 0 and V2 == 0:
         raise ValueError("Either final concentration or final volume must be specified")
     
-    result = {'C1': C1, 'V1': V1, 'C2': C2, 'V2': V2}
-    
     if C2 == 0:
-        result['C2'] = (C1 * V1) / V2
+        C2 = (C1 * V1) / V2
     elif V2 == 0:
-        result['V2'] = (C1 * V1) / C2
+        V2 = (C1 * V1) / C2
     
-    return result
+    return (C1, V1, C2, V2)
+
+def dilution_calculation(C1, V1, C2=0, V2=0):
+    """
+    Dilution calculation: C1V1 = C2V2
+    Calculate missing variable
+    """
+    return dict(zip(DILUTION_FIELDS, dilution_calculation_t(C1, V1, C2, V2)))
 
 def rate_constant(rate, conc_a, conc_b, order_a, order_b):
     """
@@ -122,6 +175,11 @@ def rate_constant(rate, conc_a, conc_b, order_a, order_b):
     Rate = k[A]^m[B]^n
     k = Rate / ([A]^m * [B]^n)
     """
+    key = (rate, conc_a, conc_b, order_a, order_b)
+    cache = _RATE_CONSTANT_CACHE
+    if cache.key == key:
+        return cache.val
+    
     if rate <= 0 or conc_a <= 0 or conc_b <= 0:
         raise ValueError("Rate and concentrations must be positive")
     
@@ -130,17 +188,19 @@ def rate_constant(rate, conc_a, conc_b, order_a, order_b):
     if denominator == 0:
         raise ValueError("Concentration terms cannot be zero")
     
-    return rate / denominator
+    cache.val = rate / denominator
+    cache.key = key
+    return cache.val
 
 def particle_in_box_energy(n, L, mass):
     """
     Energy of particle in 1D box
     E = n²h²/(8mL²)
     """
-    if n <= 0 or L <= 0 or mass <= 0:
+    if (n <= 0) | (L <= 0) | (mass <= 0):
         raise ValueError("All parameters must be positive")
     
-    return (n**2 * PLANCK_CONSTANT**2) / (8 * mass * L**2)
+    return (n * n) * _PLANCK_SQ * INV_EIGHT / (mass * L * L)
 
 def harmonic_oscillator_energy(v, frequency):
     """
@@ -150,7 +210,7 @@ def harmonic_oscillator_energy(v, frequency):
     if v < 0 or frequency <= 0:
         raise ValueError("v must be non-negative, frequency must be positive")
     
-    return PLANCK_CONSTANT * frequency * (v + 0.5)
+    return PLANCK_CONSTANT * frequency * (v + HALF)
 
 def hydrogen_energy_level(n):
     """
@@ -160,17 +220,49 @@ def hydrogen_energy_level(n):
     if n <= 0:
         raise ValueError("Principal quantum number must be positive")
     
-    return -13.6 * ELECTRON_VOLT / (n**2)
+    return _HYDROGEN_E0 / (n * n)
 
-def arrhenius_equation(A, Ea, T):
+def arrhenius_equation(A, Ea, T, beta=0):
     """
     Arrhenius equation for reaction rate
-    k = A * exp(-Ea/RT)
+    k = A * T^beta * exp(-Ea/RT), beta = 0 for the classic form
     """
+    key = (A, Ea, T, beta)
+    cache = _ARRHENIUS_CACHE
+    if cache.key == key:
+        return cache.val
+    
     if A <= 0 or Ea < 0 or T <= 0:
         raise ValueError("A and T must be positive, Ea must be non-negative")
     
-    return A * math.exp(-Ea / (GAS_CONSTANT_J * T))
+    k = A * math.exp(-Ea * INV_GAS_CONSTANT_J / T)
+    if beta:
+        k *= T ** beta
+    
+    cache.val = k
+    cache.key = key
+    return k
+
+def fit_reverse_arrhenius(A, beta, Ea, dH, dS, T1, T2, T3):
+    """
+    Reverse-reaction Arrhenius parameters from forward ones
+    k_r = k_f / K_eq, K_eq = exp(dS/R - dH/RT)
+    A_r = A exp(-dS/R), beta_r = beta, Ea_r = Ea - dH
+    The closed form is exact, so a barrierless reverse (Ea == dH) gives Ea_r == 0.0;
+    T1, T2, T3 are the fit temperatures and are only validated
+    Returns (A_r, beta_r, Ea_r) for arrhenius_equation(A_r, Ea_r, T, beta_r)
+    """
+    if T1 <= 0 or T2 <= 0 or T3 <= 0:
+        raise ValueError("Temperatures must be positive")
+    
+    if T1 == T2 or T2 == T3 or T1 == T3:
+        raise ValueError("Fit temperatures must be distinct")
+    
+    if A <= 0:
+        raise ValueError("Pre-exponential factor must be positive")
+    
+    # ln k_r = ln k_f - ln K_eq is already of the form ln A_r + beta_r ln T - Ea_r/RT
+    return (A * math.exp(-dS * INV_GAS_CONSTANT_J), beta, Ea - dH)
 
 def henderson_hasselbalch(pKa, conc_base, conc_acid):
     """
@@ -190,10 +282,15 @@ def nernst_equation(E_standard, n, Q, T=298.15):
     if n <= 0:
         raise ValueError("Number of electrons must be positive")
     
-    R = GAS_CONSTANT_J  # J/(mol·K)
-    F = FARADAY_CONSTANT  # C/mol
+    # RT/(nF) only depends on n and T, so Q-only changes reuse it
+    key = (n, T)
+    cache = _NERNST_PREFACTOR_CACHE
+    if cache.key != key:
+        R = GAS_CONSTANT_J  # J/(mol·K)
+        cache.val = R * T * INV_FARADAY / n
+        cache.key = key
     
-    return E_standard - (R * T / (n * F)) * math.log(Q)
+    return E_standard - cache.val * math.log(Q)
 
 def beer_lambert_law(epsilon, path_length, concentration):
     """
@@ -210,14 +307,15 @@ def van_der_waals_pressure(n, V, T, a, b):
     Van der Waals equation of state
     P = (nRT)/(V-nb) - an²/V²
     """
-    if n <= 0 or V <= 0 or T <= 0:
+    if (n <= 0) | (V <= 0) | (T <= 0):
         raise ValueError("n, V, and T must be positive")
     
-    if V <= n * b:
+    nb = n * b
+    if V <= nb:
         raise ValueError("Volume too small for van der Waals equation")
     
     R = GAS_CONSTANT_J
-    term1 = (n * R * T) / (V - n * b)
-    term2 = (a * n**2) / (V**2)
+    term1 = (n * R * T) / (V - nb)
+    term2 = (a * n * n) / (V * V)
     
     return term1 - term2
@@ -0,0 +1,239 @@
+"""
+Vectorized chemistry calculations for desktop Python
+Batch versions of chemistry.py functions built on NumPy (not for calculators)
+"""
+
+import math
+import re
+import numpy as np
+from constants import GAS_CONSTANT, GAS_CONSTANT_J, FARADAY_CONSTANT
+from chemistry import ATOMIC_MASS_SYMBOLS, ATOMIC_MASS_VALUES
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Batch formula tokenizer and symbol -> mass gather table
+# Formulas are joined with ";" so the whole batch is checked and split in one pass
+# ASCII digits and \Z (not $) so input the scalar scanner rejects, such as a
+# trailing newline or non-ASCII digits, is rejected here too
+_FORMULA_CHECK = re.compile(r"(?:[A-Z][a-z]?\d*)+\Z", re.ASCII)
+_BATCH_CHECK = re.compile(r"(?:[A-Z][a-z]?\d*)+(?:;(?:[A-Z][a-z]?\d*)+)*\Z", re.ASCII)
+_BATCH_RE = re.compile(r"([A-Z][a-z]?)(\d*)|;", re.ASCII)
+_SYM_IDX = {s: i for i, s in enumerate(ATOMIC_MASS_SYMBOLS)}
+_SYM_IDX[""] = -1  # formula separator
+_MASS_ARR = np.array(ATOMIC_MASS_VALUES, dtype=np.float64)
+
+def _check_formula(formula):
+    """Raise ValueError naming the problem with a single formula"""
+    if not formula:
+        raise ValueError("Formula cannot be empty")
+
+    if not _FORMULA_CHECK.match(formula):
+        raise ValueError(f"Invalid formula: {formula}")
+
+def molecular_weights(formulas):
+    """
+    Molecular weights for a batch of formulas
+    Example: molecular_weights(["H2O", "CO2"]) returns array([18.015, 44.009])
+    """
+    formulas = list(formulas)
+    if not formulas:
+        return np.empty(0, dtype=np.float64)
+
+    joined = ";".join(formulas)
+    if joined.count(";") != len(formulas) - 1 or not _BATCH_CHECK.match(joined):
+        for formula in formulas:
+            _check_formula(formula)
+
+    tokens = _BATCH_RE.findall(joined)
+    try:
+        idx = np.fromiter((_SYM_IDX[e] for e, _ in tokens), dtype=np.intp, count=len(tokens))
+    except KeyError as e:
+        raise ValueError(f"Unknown element: {e.args[0]}") from None
+    cnt = np.fromiter((int(n) if n else 1 for _, n in tokens), dtype=np.float64, count=len(tokens))
+
+    # Separators weigh nothing and open the next formula's segment
+    sep = idx < 0
+    masses = np.where(sep, 0.0, _MASS_ARR[idx] * cnt)
+    starts = np.concatenate(([0], np.flatnonzero(sep)))
+    return np.add.reduceat(masses, starts)
+
+# Temperature-sweep kernels: compiled loops with Numba, NumPy ufuncs otherwise
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _arrhenius_kernel(A, Ea, T):
+        out = np.empty_like(T)
+        for i in prange(T.size):
+            out[i] = A * math.exp(-Ea / (GAS_CONSTANT_J * T[i]))
+        return out
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _van_der_waals_kernel(n, V, T, a, b):
+        out = np.empty_like(T)
+        for i in prange(T.size):
+            v = V[i]
+            out[i] = (n * GAS_CONSTANT_J * T[i]) / (v - n * b) - (a * n * n) / (v * v)
+        return out
+else:
+    def _arrhenius_kernel(A, Ea, T):
+        return A * np.exp(-Ea / (GAS_CONSTANT_J * T))
+
+    def _van_der_waals_kernel(n, V, T, a, b):
+        return (n * GAS_CONSTANT_J * T) / (V - n * b) - (a * n * n) / (V * V)
+
+def arrhenius_array(A, Ea, T):
+    """
+    Arrhenius rate constants over an array of temperatures
+    k = A * exp(-Ea/RT)
+    """
+    T = np.asarray(T, dtype=np.float64)
+    k = _arrhenius_kernel(float(A), float(Ea), np.ascontiguousarray(T.ravel()))
+    return k.reshape(T.shape)
+
+def van_der_waals_pressure_array(n, V, T, a, b):
+    """
+    Van der Waals pressure over arrays of volume and/or temperature
+    P = (nRT)/(V-nb) - an²/V²
+    """
+    V, T = np.broadcast_arrays(np.asarray(V, dtype=np.float64),
+                               np.asarray(T, dtype=np.float64))
+    P = _van_der_waals_kernel(float(n), np.ascontiguousarray(V.ravel()),
+                              np.ascontiguousarray(T.ravel()), float(a), float(b))
+    return P.reshape(T.shape)
+
+# Design matrix [ln T, 1/T] for the last temperature grid seen
+_design_T = None
+_design_X = None
+
+def _design_matrix(T):
+    """Build the Arrhenius design matrix, reused while T is unchanged"""
+    global _design_T, _design_X
+    if _design_T is None or not np.array_equal(_design_T, T):
+        _design_T = T.copy()
+        _design_X = np.column_stack([np.log(T), 1.0 / T])
+    return _design_X
+
+def arrhenius_batch(A, beta, Ea, T):
+    """
+    Modified Arrhenius rate constants for many reactions over a temperature grid
+    ln k = [ln T, 1/T] · [beta, -Ea/R] + ln A, one GEMM and one exp
+    Returns an array of shape (len(T), len(A)), NaN where T <= 0 or A <= 0
+    """
+    A = np.asarray(A, dtype=np.float64).ravel()
+    beta = np.asarray(beta, dtype=np.float64).ravel()
+    Ea = np.asarray(Ea, dtype=np.float64).ravel()
+    T = np.asarray(T, dtype=np.float64).ravel()
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        X = _design_matrix(T)
+        W = np.vstack([beta, -Ea / GAS_CONSTANT_J])
+        k = np.exp(X @ W + np.log(A)[None, :])
+    return np.where((T <= 0)[:, None] | (A <= 0)[None, :], np.nan, k)
+
+def arrhenius_batch_2p(A, Ea, T):
+    """
+    Two-parameter Arrhenius (beta = 0) for many reactions over a temperature grid
+    Returns an array of shape (len(T), len(A)), NaN where T <= 0 or A <= 0
+    """
+    A = np.asarray(A, dtype=np.float64).ravel()
+    Ea = np.asarray(Ea, dtype=np.float64).ravel()
+    T = np.asarray(T, dtype=np.float64).ravel()
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        X = _design_matrix(T)
+        k = np.exp(X[:, 1:] @ (-Ea / GAS_CONSTANT_J)[None, :] + np.log(A)[None, :])
+    return np.where((T <= 0)[:, None] | (A <= 0)[None, :], np.nan, k)
+
+# Array forms of the scalar solvers: invalid entries become NaN instead of raising
+def _arrays(*values):
+    return [np.asarray(v, dtype=np.float64) for v in values]
+
+def ideal_gas_pressure_array(n, V, T):
+    """
+    Ideal gas pressure: P = nRT/V (atm)
+    NaN where V <= 0
+    """
+    n, V, T = _arrays(n, V, T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        P = n * GAS_CONSTANT * T / V
+    return np.where(V <= 0, np.nan, P)
+
+def ideal_gas_volume_array(P, n, T):
+    """
+    Ideal gas volume: V = nRT/P (L)
+    NaN where P <= 0
+    """
+    P, n, T = _arrays(P, n, T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        V = n * GAS_CONSTANT * T / P
+    return np.where(P <= 0, np.nan, V)
+
+def ideal_gas_moles_array(P, V, T):
+    """
+    Ideal gas amount: n = PV/(RT) (mol)
+    NaN where T <= 0
+    """
+    P, V, T = _arrays(P, V, T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n = P * V / (GAS_CONSTANT * T)
+    return np.where(T <= 0, np.nan, n)
+
+def ideal_gas_temperature_array(P, V, n):
+    """
+    Ideal gas temperature: T = PV/(nR) (K)
+    NaN where n <= 0
+    """
+    P, V, n = _arrays(P, V, n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        T = P * V / (n * GAS_CONSTANT)
+    return np.where(n <= 0, np.nan, T)
+
+def dilution_concentration_array(C1, V1, V2):
+    """
+    Final concentration after dilution: C2 = C1V1/V2
+    NaN where C1, V1 or V2 is non-positive
+    """
+    C1, V1, V2 = _arrays(C1, V1, V2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        C2 = C1 * V1 / V2
+    return np.where((C1 <= 0) | (V1 <= 0) | (V2 <= 0), np.nan, C2)
+
+def dilution_volume_array(C1, V1, C2):
+    """
+    Final volume after dilution: V2 = C1V1/C2
+    NaN where C1, V1 or C2 is non-positive
+    """
+    C1, V1, C2 = _arrays(C1, V1, C2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        V2 = C1 * V1 / C2
+    return np.where((C1 <= 0) | (V1 <= 0) | (C2 <= 0), np.nan, V2)
+
+def beer_lambert_array(epsilon, path_length, concentration):
+    """
+    Absorbance: A = ε * l * c
+    NaN where ε < 0, l <= 0 or c < 0
+    """
+    epsilon, path_length, concentration = _arrays(epsilon, path_length, concentration)
+    A = epsilon * path_length * concentration
+    invalid = (epsilon < 0) | (path_length <= 0) | (concentration < 0)
+    return np.where(invalid, np.nan, A)
+
+def henderson_hasselbalch_array(pKa, conc_base, conc_acid):
+    """
+    Buffer pH: pH = pKa + log([A-]/[HA])
+    NaN where either concentration is non-positive
+    """
+    pKa, conc_base, conc_acid = _arrays(pKa, conc_base, conc_acid)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pH = pKa + np.log10(conc_base / conc_acid)
+    return np.where((conc_base <= 0) | (conc_acid <= 0), np.nan, pH)
+
+def nernst_array(E_standard, n, Q, T=298.15):
+    """
+    Cell potential: E = E° - (RT/nF)ln(Q)
+    NaN where n <= 0 or Q <= 0
+    """
+    E_standard, n, Q, T = _arrays(E_standard, n, Q, T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        E = E_standard - (GAS_CONSTANT_J * T / (n * FARADAY_CONSTANT)) * np.log(Q)
+    return np.where((n <= 0) | (Q <= 0), np.nan, E)
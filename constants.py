@@ -3,11 +3,16 @@ Physical and mathematical constants for chemistry and physics calculations
 Optimized for MicroPython memory efficiency
 """
 
-import math
+try:
+    from array import array
+except ImportError:
+    # Ports without the array module keep table values in plain tuples
+    def array(typecode, values):
+        return tuple(values)
 
 # Mathematical constants
-PI = math.pi
-E = math.e
+PI = 3.141592653589793
+E = 2.718281828459045
 
 # Physical constants (SI units unless noted)
 SPEED_OF_LIGHT = 2.998e8          # m/s
@@ -32,7 +37,7 @@ GRAVITATIONAL_CONSTANT = 6.674e-11  # N·m²/kg²
 # Electromagnetic constants
 COULOMB_CONSTANT = 8.988e9        # N·m²/C²
 VACUUM_PERMITTIVITY = 8.854e-12   # C²/(N·m²)
-VACUUM_PERMEABILITY = 4e-7 * PI   # N/A²
+VACUUM_PERMEABILITY = 1.2566370614359173e-6  # N/A² (4π × 10⁻⁷)
 FARADAY_CONSTANT = 96485          # C/mol
 
 # Energy conversion factors
@@ -55,12 +60,25 @@ STP_PRESSURE = 101325             # Pa (1 atm)
 STANDARD_ATMOSPHERE = 101325      # Pa
 
 # Mathematical conversion factors
-DEGREES_TO_RADIANS = PI / 180
-RADIANS_TO_DEGREES = 180 / PI
+DEGREES_TO_RADIANS = 0.017453292519943295  # π/180
+RADIANS_TO_DEGREES = 57.29577951308232     # 180/π
 
 # Common logarithms
-LN_10 = math.log(10)              # Natural log of 10
-LOG10_E = math.log10(E)           # Log base 10 of e
+LN_10 = 2.302585092994046         # Natural log of 10
+LOG10_E = 0.4342944819032518      # Log base 10 of e
+
+# Precomputed reciprocals and ratios (multiply instead of divide)
+INV_FARADAY = 1.0 / FARADAY_CONSTANT
+INV_GAS_CONSTANT_J = 1.0 / GAS_CONSTANT_J
+INV_PLANCK = 1.0 / PLANCK_CONSTANT
+FIVE_NINTHS = 5.0 / 9.0
+NINE_FIFTHS = 9.0 / 5.0
+
+# Shared numeric literals (one float object instead of one per use)
+ZERO_C_IN_K = 273.15              # 0°C in Kelvin
+HYDROGEN_E0_EV = 13.6             # Hydrogen ground-state binding energy, eV
+HALF = 0.5
+INV_EIGHT = 0.125
 
 # Chemistry-specific constants
 WATER_DENSITY = 1000              # kg/m³ at 4°C
@@ -97,94 +115,163 @@ PSI_TO_PA = 6895
 # Temperature conversion functions
 def celsius_to_kelvin(celsius):
     """Convert Celsius to Kelvin"""
-    return celsius + 273.15
+    return celsius + ZERO_C_IN_K
 
 def kelvin_to_celsius(kelvin):
     """Convert Kelvin to Celsius"""
-    return kelvin - 273.15
+    return kelvin - ZERO_C_IN_K
 
 def fahrenheit_to_celsius(fahrenheit):
     """Convert Fahrenheit to Celsius"""
-    return (fahrenheit - 32) * 5/9
+    return (fahrenheit - 32) * FIVE_NINTHS
 
 def celsius_to_fahrenheit(celsius):
     """Convert Celsius to Fahrenheit"""
-    return celsius * 9/5 + 32
+    return celsius * NINE_FIFTHS + 32
 
 def fahrenheit_to_kelvin(fahrenheit):
     """Convert Fahrenheit to Kelvin"""
-    return celsius_to_kelvin(fahrenheit_to_celsius(fahrenheit))
+    return (fahrenheit - 32) * FIVE_NINTHS + ZERO_C_IN_K
 
 def kelvin_to_fahrenheit(kelvin):
     """Convert Kelvin to Fahrenheit"""
-    return celsius_to_fahrenheit(kelvin_to_celsius(kelvin))
+    return (kelvin - ZERO_C_IN_K) * NINE_FIFTHS + 32
 
 # Common physical properties (for quick reference)
-COMMON_DENSITIES = {
-    'water': 1000,      # kg/m³
-    'air': 1.225,       # kg/m³ at STP
-    'aluminum': 2700,   # kg/m³
-    'iron': 7870,       # kg/m³
-    'copper': 8960,     # kg/m³
-    'gold': 19300,      # kg/m³
-    'lead': 11340       # kg/m³
-}
-
-COMMON_SPECIFIC_HEATS = {
-    'water': 4186,      # J/(kg·K)
-    'air': 1005,        # J/(kg·K)
-    'aluminum': 897,    # J/(kg·K)
-    'iron': 449,        # J/(kg·K)
-    'copper': 385,      # J/(kg·K)
-    'gold': 129,        # J/(kg·K)
-    'ice': 2090         # J/(kg·K)
-}
+# Sorted name tuples with parallel value arrays instead of dicts
+DENSITY_MATERIALS = (
+    'air', 'aluminum', 'copper', 'gold', 'iron', 'lead', 'water'
+)
+_DENSITY_VALUES = array('d', (
+    1.225, 2700, 8960, 19300, 7870, 11340, 1000   # kg/m³ (air at STP)
+))
+
+SPECIFIC_HEAT_MATERIALS = (
+    'air', 'aluminum', 'copper', 'gold', 'ice', 'iron', 'water'
+)
+_SPECIFIC_HEAT_VALUES = array('d', (
+    1005, 897, 385, 129, 2090, 449, 4186          # J/(kg·K)
+))
 
 # Periodic table data (simplified for memory efficiency)
-PERIODIC_SYMBOLS = [
+# Atomic number is the position in this tuple plus one
+PERIODIC_SYMBOLS = (
     'H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne',
     'Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar', 'K', 'Ca'
-]
-
-ATOMIC_NUMBERS = {
-    'H': 1, 'He': 2, 'Li': 3, 'Be': 4, 'B': 5, 'C': 6, 'N': 7, 'O': 8,
-    'F': 9, 'Ne': 10, 'Na': 11, 'Mg': 12, 'Al': 13, 'Si': 14, 'P': 15,
-    'S': 16, 'Cl': 17, 'Ar': 18, 'K': 19, 'Ca': 20
-}
+)
+
+def table_lookup(keys, values, key):
+    """
+    Binary search a sorted key tuple and return the parallel value
+    Returns None when the key is not in the table
+    """
+    lo = 0
+    hi = len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if keys[mid] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    if lo < len(keys) and keys[lo] == key:
+        return values[lo]
+    return None
+
+def density(material):
+    """Density of a common material in kg/m³"""
+    value = table_lookup(DENSITY_MATERIALS, _DENSITY_VALUES, material)
+    if value is None:
+        raise ValueError(f"Unknown material: {material}")
+    return value
+
+def specific_heat(material):
+    """Specific heat of a common material in J/(kg·K)"""
+    value = table_lookup(SPECIFIC_HEAT_MATERIALS, _SPECIFIC_HEAT_VALUES, material)
+    if value is None:
+        raise ValueError(f"Unknown material: {material}")
+    return value
+
+def atomic_number(symbol):
+    """Atomic number of an element in PERIODIC_SYMBOLS"""
+    if symbol not in PERIODIC_SYMBOLS:
+        raise ValueError(f"Unknown element: {symbol}")
+    return PERIODIC_SYMBOLS.index(symbol) + 1
 
 # Error tolerance for floating point comparisons
 FLOAT_TOLERANCE = 1e-10
 
 def approx_equal(a, b, tolerance=FLOAT_TOLERANCE):
     """Check if two floating point numbers are approximately equal"""
-    return abs(a - b) < tolerance
+    d = a - b
+    return -tolerance < d < tolerance
 
 # Common mathematical functions optimized for calculators
+# math is imported on first use so loading constants does not pull it in
 def safe_sqrt(x):
     """Square root with domain checking"""
+    import math
     if x < 0:
         raise ValueError("Cannot take square root of negative number")
     return math.sqrt(x)
 
+_LOG_DOMAIN_ERROR = "Cannot take logarithm of non-positive number"
+
+def safe_ln(x):
+    """Natural logarithm with domain checking"""
+    import math
+    if x <= 0:
+        raise ValueError(_LOG_DOMAIN_ERROR)
+    return math.log(x)
+
+def safe_log10(x):
+    """Base-10 logarithm with domain checking"""
+    import math
+    if x <= 0:
+        raise ValueError(_LOG_DOMAIN_ERROR)
+    return math.log10(x)
+
+def make_safe_log(base):
+    """
+    Build a domain-checked logarithm for a fixed base
+    1/ln(base) is computed once; each call is one log and one multiply
+    """
+    import math
+    if base <= 0 or base == 1:
+        raise ValueError("Logarithm base must be positive and not 1")
+    
+    log = math.log
+    inv_log_base = 1.0 / log(base)
+    
+    def safe_log_base(x):
+        if x <= 0:
+            raise ValueError(_LOG_DOMAIN_ERROR)
+        return log(x) * inv_log_base
+    
+    return safe_log_base
+
 def safe_log(x, base=E):
     """Logarithm with domain checking"""
-    if x <= 0:
-        raise ValueError("Cannot take logarithm of non-positive number")
     if base == E:
-        return math.log(x)
+        return safe_ln(x)
     elif base == 10:
-        return math.log10(x)
-    else:
-        return math.log(x) / math.log(base)
+        return safe_log10(x)
+    
+    import math
+    if x <= 0:
+        raise ValueError(_LOG_DOMAIN_ERROR)
+    return math.log(x) / math.log(base)
 
 def safe_asin(x):
     """Arcsine with domain checking"""
+    import math
     if abs(x) > 1:
         raise ValueError("Arcsine domain error: |x| must be ≤ 1")
     return math.asin(x)
 
 def safe_acos(x):
     """Arccosine with domain checking"""
+    import math
     if abs(x) > 1:
         raise ValueError("Arccosine domain error: |x| must be ≤ 1")
     return math.acos(x)
@@ -3,24 +3,78 @@ Main interface for MicroPython Computational Chemistry and Physics
 Optimized for graphing calculators (TI-84 Plus CE Python, NumWorks, Casio Graph 90+E)
 """
 
-import chemistry
-import physics
-import examples
-from utils import display_menu, get_user_input, clear_screen
+from utils import display_menu, get_user_input, read_float, clear_screen, write_text
+
+# "name: value" result lines, format spec parsed once
+_FMT2 = "{}: {:.2f}".format
+_FMT4 = "{}: {:.4f}".format
+
+# Menu screens are built once at import and written in a single call
+_MAIN_MENU = (
+    "=== Computational Chem/Physics ===\n"
+    "1. Chemistry Calculations\n"
+    "2. Physics Calculations\n"
+    "3. View Examples\n"
+    "4. About/Help\n"
+    "0. Exit\n"
+    + "=" * 35 + "\n"
+)
+
+_CHEM_MENU = (
+    "=== Chemistry Calculations ===\n"
+    "1. Molecular Weight\n"
+    "2. Ideal Gas Law\n"
+    "3. pH Calculations\n"
+    "4. Concentration/Dilution\n"
+    "5. Rate Law\n"
+    "6. Quantum Energy Levels\n"
+    "0. Back to Main Menu\n"
+    + "=" * 31 + "\n"
+)
+
+_PHYS_MENU = (
+    "=== Physics Calculations ===\n"
+    "1. Kinematics\n"
+    "2. Force & Motion\n"
+    "3. Energy & Work\n"
+    "4. Thermodynamics\n"
+    "5. Waves & Oscillations\n"
+    "6. Electromagnetism\n"
+    "0. Back to Main Menu\n"
+    + "=" * 29 + "\n"
+)
+
+_HELP_TEXT = (
+    "=== Help & About ===\n"
+    "MicroPython Computational Chemistry & Physics\n"
+    "Version 1.0\n"
+    "\n"
+    "This calculator provides essential computational\n"
+    "tools for chemistry and physics calculations\n"
+    "optimized for graphing calculators.\n"
+    "\n"
+    "Compatible with:\n"
+    "- TI-84 Plus CE Python\n"
+    "- NumWorks\n"
+    "- Casio Graph 90+E\n"
+    "\n"
+    "For installation instructions, see\n"
+    "install_guide.md\n"
+    "\n"
+    "Memory usage optimized for calculator\n"
+    "hardware limitations.\n"
+)
 
 def main_menu():
     """Display main menu and handle user selection"""
+    # Loop-invariant globals bound to locals once per menu session
+    clear, write, get = clear_screen, write_text, get_user_input
+    
     while True:
-        clear_screen()
-        print("=== Computational Chem/Physics ===")
-        print("1. Chemistry Calculations")
-        print("2. Physics Calculations")
-        print("3. View Examples")
-        print("4. About/Help")
-        print("0. Exit")
-        print("=" * 35)
+        clear()
+        write(_MAIN_MENU)
         
-        choice = get_user_input("Select option (0-4): ")
+        choice = get("Select option (0-4): ")
         
         if choice == "1":
             chemistry_menu()
@@ -39,19 +93,17 @@ def main_menu():
 
 def chemistry_menu():
     """Chemistry calculations submenu"""
+    # Imported on first entry; the calculators below use the module global
+    global chemistry
+    import chemistry
+    
+    clear, write, get = clear_screen, write_text, get_user_input
+    
     while True:
-        clear_screen()
-        print("=== Chemistry Calculations ===")
-        print("1. Molecular Weight")
-        print("2. Ideal Gas Law")
-        print("3. pH Calculations")
-        print("4. Concentration/Dilution")
-        print("5. Rate Law")
-        print("6. Quantum Energy Levels")
-        print("0. Back to Main Menu")
-        print("=" * 31)
+        clear()
+        write(_CHEM_MENU)
         
-        choice = get_user_input("Select calculation (0-6): ")
+        choice = get("Select calculation (0-6): ")
         
         if choice == "1":
             mol_weight_calc()
@@ -73,19 +125,16 @@ def chemistry_menu():
 
 def physics_menu():
     """Physics calculations submenu"""
+    global physics
+    import physics
+    
+    clear, write, get = clear_screen, write_text, get_user_input
+    
     while True:
-        clear_screen()
-        print("=== Physics Calculations ===")
-        print("1. Kinematics")
-        print("2. Force & Motion")
-        print("3. Energy & Work")
-        print("4. Thermodynamics")
-        print("5. Waves & Oscillations")
-        print("6. Electromagnetism")
-        print("0. Back to Main Menu")
-        print("=" * 29)
+        clear()
+        write(_PHYS_MENU)
         
-        choice = get_user_input("Select calculation (0-6): ")
+        choice = get("Select calculation (0-6): ")
         
         if choice == "1":
             kinematics_calc()
@@ -125,16 +174,17 @@ def ideal_gas_calc():
     print("=== Ideal Gas Law (PV = nRT) ===")
     print("Enter known values (0 for unknown):")
     
-    P = float(get_user_input("Pressure (atm): ") or "0")
-    V = float(get_user_input("Volume (L): ") or "0")
-    n = float(get_user_input("Moles: ") or "0")
-    T = float(get_user_input("Temperature (K): ") or "0")
+    read = read_float
+    P = read("Pressure (atm): ")
+    V = read("Volume (L): ")
+    n = read("Moles: ")
+    T = read("Temperature (K): ")
     
     try:
         result = chemistry.ideal_gas_law(P, V, n, T)
-        for key, value in result.items():
-            if value is not None:
-                print(f"{key}: {value:.4f}")
+        for item in result.items():
+            if item[1] is not None:
+                print(_FMT4(*item))
     except Exception as e:
         print(f"Error: {e}")
     
@@ -174,16 +224,17 @@ def concentration_calc():
     print("=== Concentration Calculator ===")
     print("Dilution: C1V1 = C2V2")
     
-    C1 = float(get_user_input("Initial concentration (M): "))
-    V1 = float(get_user_input("Initial volume (L): "))
-    C2 = float(get_user_input("Final concentration (M, 0 if unknown): ") or "0")
-    V2 = float(get_user_input("Final volume (L, 0 if unknown): ") or "0")
+    to_float, get, read = float, get_user_input, read_float
+    C1 = to_float(get("Initial concentration (M): "))
+    V1 = to_float(get("Initial volume (L): "))
+    C2 = read("Final concentration (M, 0 if unknown): ")
+    V2 = read("Final volume (L, 0 if unknown): ")
     
     try:
         result = chemistry.dilution_calculation(C1, V1, C2, V2)
-        for key, value in result.items():
-            if value is not None:
-                print(f"{key}: {value:.4f}")
+        for item in result.items():
+            if item[1] is not None:
+                print(_FMT4(*item))
     except Exception as e:
         print(f"Error: {e}")
     
@@ -196,11 +247,12 @@ def rate_law_calc():
     print("Rate = k[A]^m[B]^n")
     
     try:
-        rate = float(get_user_input("Reaction rate (M/s): "))
-        conc_a = float(get_user_input("Concentration of A (M): "))
-        conc_b = float(get_user_input("Concentration of B (M): "))
-        order_a = float(get_user_input("Order with respect to A: "))
-        order_b = float(get_user_input("Order with respect to B: "))
+        to_float, get = float, get_user_input
+        rate = to_float(get("Reaction rate (M/s): "))
+        conc_a = to_float(get("Concentration of A (M): "))
+        conc_b = to_float(get("Concentration of B (M): "))
+        order_a = to_float(get("Order with respect to A: "))
+        order_b = to_float(get("Order with respect to B: "))
         
         k = chemistry.rate_constant(rate, conc_a, conc_b, order_a, order_b)
         overall_order = order_a + order_b
@@ -258,16 +310,16 @@ def kinematics_calc():
             a = float(get_user_input("Acceleration (m/s²): "))
             t = float(get_user_input("Time (s): "))
             
-            result = physics.constant_acceleration(v0, a, t)
-            for key, value in result.items():
-                print(f"{key}: {value:.2f}")
+            result = physics.constant_acceleration_t(v0, a, t)
+            for item in zip(physics.CONSTANT_ACCELERATION_FIELDS, result):
+                print(_FMT2(*item))
         elif choice == "2":
             v0 = float(get_user_input("Initial velocity (m/s): "))
             angle = float(get_user_input("Launch angle (degrees): "))
             
-            result = physics.projectile_motion(v0, angle)
-            for key, value in result.items():
-                print(f"{key}: {value:.2f}")
+            result = physics.projectile_motion_t(v0, angle)
+            for item in zip(physics.PROJECTILE_FIELDS, result):
+                print(_FMT2(*item))
     except Exception as e:
         print(f"Error: {e}")
     
@@ -329,7 +381,7 @@ def energy_calc():
         elif choice == "3":
             force = float(get_user_input("Force (N): "))
             distance = float(get_user_input("Distance (m): "))
-            angle = float(get_user_input("Angle (degrees, 0 if parallel): ") or "0")
+            angle = read_float("Angle (degrees, 0 if parallel): ")
             work = physics.work_done(force, distance, angle)
             print(f"Work done = {work:.2f} J")
     except Exception as e:
@@ -426,14 +478,13 @@ def electro_calc():
             print(f"Electric field = {field:.2e} N/C")
         elif choice == "3":
             print("V = IR")
-            V = float(get_user_input("Voltage (V, 0 if unknown): ") or "0")
-            I = float(get_user_input("Current (A, 0 if unknown): ") or "0")
-            R = float(get_user_input("Resistance (Ω, 0 if unknown): ") or "0")
+            V = read_float("Voltage (V, 0 if unknown): ")
+            I = read_float("Current (A, 0 if unknown): ")
+            R = read_float("Resistance (Ω, 0 if unknown): ")
             
-            result = physics.ohms_law(V, I, R)
-            for key, value in result.items():
-                if value is not None:
-                    print(f"{key}: {value:.4f}")
+            result = physics.ohms_law_t(V, I, R)
+            for item in zip(physics.OHMS_LAW_FIELDS, result):
+                print(_FMT4(*item))
         elif choice == "4":
             q = float(get_user_input("Charge (C): "))
             v = float(get_user_input("Velocity (m/s): "))
@@ -447,6 +498,7 @@ def electro_calc():
 
 def examples_menu():
     """Show example calculations"""
+    import examples
     clear_screen()
     print("=== Example Calculations ===")
     examples.show_examples()
@@ -455,24 +507,7 @@ def examples_menu():
 def show_help():
     """Display help information"""
     clear_screen()
-    print("=== Help & About ===")
-    print("MicroPython Computational Chemistry & Physics")
-    print("Version 1.0")
-    print("")
-    print("This calculator provides essential computational")
-    print("tools for chemistry and physics calculations")
-    print("optimized for graphing calculators.")
-    print("")
-    print("Compatible with:")
-    print("- TI-84 Plus CE Python")
-    print("- NumWorks")
-    print("- Casio Graph 90+E")
-    print("")
-    print("For installation instructions, see")
-    print("install_guide.md")
-    print("")
-    print("Memory usage optimized for calculator")
-    print("hardware limitations.")
+    write_text(_HELP_TEXT)
     
     input("\nPress any key to continue...")
 
@@ -3,53 +3,64 @@ Physics calculation functions for MicroPython
 Optimized for memory efficiency on graphing calculators
 """
 
-import math
-from constants import *
+from math import sqrt, sin, cos
+from constants import (GRAVITY, COULOMB_CONSTANT, SPEED_OF_LIGHT, PLANCK_CONSTANT,
+                       DEGREES_TO_RADIANS)
+from utils import lru_cache
 
-def constant_acceleration(v0, a, t):
+CONSTANT_ACCELERATION_FIELDS = ('position', 'velocity', 'acceleration', 'time')
+PROJECTILE_FIELDS = ('range', 'max_height', 'flight_time', 'v0x', 'v0y')
+OHMS_LAW_FIELDS = ('V', 'I', 'R')
+LENS_FIELDS = ('f', 'do', 'di')
+
+def constant_acceleration_t(v0, a, t):
     """
     Kinematic equations for constant acceleration
-    Returns position, velocity, and acceleration
+    Returns (position, velocity, acceleration, time) tuple
     """
     v = v0 + a * t
-    x = v0 * t + 0.5 * a * t**2
+    x = v0 * t + 0.5 * a * t * t
     
-    return {
-        'position': x,
-        'velocity': v,
-        'acceleration': a,
-        'time': t
-    }
+    return (x, v, a, t)
 
-def projectile_motion(v0, angle_deg):
+def constant_acceleration(v0, a, t):
+    """
+    Kinematic equations for constant acceleration
+    Returns position, velocity, and acceleration
+    """
+    return dict(zip(CONSTANT_ACCELERATION_FIELDS, constant_acceleration_t(v0, a, t)))
+
+def projectile_motion_t(v0, angle_deg):
     """
     Projectile motion calculations
-    Returns range, max height, and flight time
+    Returns (range, max_height, flight_time, v0x, v0y) tuple
     """
-    angle_rad = math.radians(angle_deg)
+    angle_rad = angle_deg * DEGREES_TO_RADIANS
     g = GRAVITY
     
     # Components of initial velocity
-    v0x = v0 * math.cos(angle_rad)
-    v0y = v0 * math.sin(angle_rad)
+    v0x = v0 * cos(angle_rad)
+    v0y = v0 * sin(angle_rad)
     
     # Flight time
     flight_time = 2 * v0y / g
     
     # Maximum height
-    max_height = (v0y**2) / (2 * g)
+    max_height = (v0y * v0y) / (2 * g)
     
     # Range
     range_x = v0x * flight_time
     
-    return {
-        'range': range_x,
-        'max_height': max_height,
-        'flight_time': flight_time,
-        'v0x': v0x,
-        'v0y': v0y
-    }
+    return (range_x, max_height, flight_time, v0x, v0y)
 
+def projectile_motion(v0, angle_deg):
+    """
+    Projectile motion calculations
+    Returns range, max height, and flight time
+    """
+    return dict(zip(PROJECTILE_FIELDS, projectile_motion_t(v0, angle_deg)))
+
+# Native twin in physics_native.py; keep in sync (python check_native.py)
 def newtons_second_law(mass, acceleration):
     """
     Newton's second law: F = ma
@@ -59,6 +70,7 @@ def newtons_second_law(mass, acceleration):
     
     return mass * acceleration
 
+# Native twin in physics_native.py; keep in sync (python check_native.py)
 def friction_force(coefficient, normal_force):
     """
     Friction force: f = μN
@@ -75,8 +87,9 @@ def centripetal_force(mass, velocity, radius):
     if mass <= 0 or radius <= 0:
         raise ValueError("Mass and radius must be positive")
     
-    return (mass * velocity**2) / radius
+    return (mass * velocity * velocity) / radius
 
+# Native twin in physics_native.py; keep in sync (python check_native.py)
 def kinetic_energy(mass, velocity):
     """
     Kinetic energy: KE = ½mv²
@@ -84,7 +97,7 @@ def kinetic_energy(mass, velocity):
     if mass <= 0:
         raise ValueError("Mass must be positive")
     
-    return 0.5 * mass * velocity**2
+    return 0.5 * mass * velocity * velocity
 
 def gravitational_potential_energy(mass, height, g=GRAVITY):
     """
@@ -99,8 +112,8 @@ def work_done(force, distance, angle_deg=0):
     """
     Work done: W = F·d·cos(θ)
     """
-    angle_rad = math.radians(angle_deg)
-    return force * distance * math.cos(angle_rad)
+    angle_rad = angle_deg * DEGREES_TO_RADIANS
+    return force * distance * cos(angle_rad)
 
 def power_calculation(work, time):
     """
@@ -129,12 +142,14 @@ def thermal_expansion(initial_length, expansion_coeff, temp_change):
     
     return expansion_coeff * initial_length * temp_change
 
+# Native twin in physics_native.py; keep in sync (python check_native.py)
 def ideal_gas_work(pressure, volume_change):
     """
     Work done by ideal gas at constant pressure: W = PΔV
     """
     return pressure * volume_change
 
+@lru_cache(maxsize=32)
 def carnot_efficiency(hot_temp, cold_temp):
     """
     Carnot engine efficiency: η = 1 - Tc/Th
@@ -160,7 +175,10 @@ def simple_harmonic_motion(amplitude, angular_freq, time, phase=0):
     """
     Simple harmonic motion: x = A·cos(ωt + φ)
     """
-    return amplitude * math.cos(angular_freq * time + phase)
+    return amplitude * cos(angular_freq * time + phase)
+
+_TWO_PI = 6.283185307179586  # 2π
+_INV_G = 1.0 / GRAVITY
 
 def pendulum_period(length, g=GRAVITY):
     """
@@ -169,7 +187,9 @@ def pendulum_period(length, g=GRAVITY):
     if length <= 0:
         raise ValueError("Length must be positive")
     
-    return 2 * math.pi * math.sqrt(length / g)
+    if g == GRAVITY:
+        return _TWO_PI * sqrt(length * _INV_G)
+    return _TWO_PI * sqrt(length / g)
 
 def spring_period(mass, spring_constant):
     """
@@ -178,8 +198,9 @@ def spring_period(mass, spring_constant):
     if mass <= 0 or spring_constant <= 0:
         raise ValueError("Mass and spring constant must be positive")
     
-    return 2 * math.pi * math.sqrt(mass / spring_constant)
+    return _TWO_PI * sqrt(mass / spring_constant)
 
+# Native twin in physics_native.py; keep in sync (python check_native.py)
 def coulomb_force(q1, q2, distance):
     """
     Coulomb's law: F = k·q1·q2/r²
@@ -187,8 +208,9 @@ def coulomb_force(q1, q2, distance):
     if distance <= 0:
         raise ValueError("Distance must be positive")
     
-    return COULOMB_CONSTANT * q1 * q2 / (distance**2)
+    return COULOMB_CONSTANT * q1 * q2 / (distance * distance)
 
+# Native twin in physics_native.py; keep in sync (python check_native.py)
 def electric_field(charge, distance):
     """
     Electric field: E = k·q/r²
@@ -196,7 +218,7 @@ def electric_field(charge, distance):
     if distance <= 0:
         raise ValueError("Distance must be positive")
     
-    return COULOMB_CONSTANT * charge / (distance**2)
+    return COULOMB_CONSTANT * charge / (distance * distance)
 
 def electric_potential(charge, distance):
     """
@@ -207,51 +229,65 @@ def electric_potential(charge, distance):
     
     return COULOMB_CONSTANT * charge / distance
 
-def ohms_law(voltage=0, current=0, resistance=0):
+# Solvers indexed by which input is zero: bit 2 = first, bit 1 = second, bit 0 = third
+# Only single-zero masks (4, 2, 1) are solvable
+_OHMS_LAW_SOLVERS = (
+    None,
+    lambda V, I, R: (V, I, V / I),
+    lambda V, I, R: (V, V / R, R),
+    None,
+    lambda V, I, R: (I * R, I, R),
+    None, None, None
+)
+
+def ohms_law_t(voltage=0, current=0, resistance=0):
     """
     Ohm's law: V = IR
     Calculate missing variable when 2 are known
+    Returns (V, I, R) tuple
     """
-    known_count = sum(1 for x in [voltage, current, resistance] if x != 0)
+    solver = _OHMS_LAW_SOLVERS[(voltage == 0) << 2 | (current == 0) << 1 | (resistance == 0)]
     
-    if known_count != 2:
+    if solver is None:
         raise ValueError("Exactly 2 variables must be non-zero")
     
-    result = {'V': voltage, 'I': current, 'R': resistance}
-    
-    if voltage == 0:
-        result['V'] = current * resistance
-    elif current == 0:
-        if resistance == 0:
-            raise ValueError("Cannot calculate current with zero resistance")
-        result['I'] = voltage / resistance
-    elif resistance == 0:
-        if current == 0:
-            raise ValueError("Cannot calculate resistance with zero current")
-        result['R'] = voltage / current
-    
-    return result
+    return solver(voltage, current, resistance)
+
+def ohms_law(voltage=0, current=0, resistance=0):
+    """
+    Ohm's law: V = IR
+    Calculate missing variable when 2 are known
+    """
+    return dict(zip(OHMS_LAW_FIELDS, ohms_law_t(voltage, current, resistance)))
+
+# Indexed by which inputs are non-zero: bit 2 = voltage, bit 1 = current, bit 0 = resistance
+_POWER_SOLVERS = (
+    None, None, None,
+    lambda V, I, R: I * I * R,
+    None,
+    lambda V, I, R: V * V / R,
+    lambda V, I, R: V * I,
+    lambda V, I, R: V * I
+)
 
 def electrical_power(voltage=0, current=0, resistance=0):
     """
     Electrical power calculations
     P = VI = I²R = V²/R
     """
-    if voltage != 0 and current != 0:
-        return voltage * current
-    elif current != 0 and resistance != 0:
-        return current**2 * resistance
-    elif voltage != 0 and resistance != 0:
-        return voltage**2 / resistance
-    else:
+    solver = _POWER_SOLVERS[(voltage != 0) << 2 | (current != 0) << 1 | (resistance != 0)]
+    
+    if solver is None:
         raise ValueError("Need at least 2 non-zero parameters")
+    
+    return solver(voltage, current, resistance)
 
 def magnetic_force(charge, velocity, magnetic_field, angle_deg=90):
     """
     Magnetic force on moving charge: F = qvB·sin(θ)
     """
-    angle_rad = math.radians(angle_deg)
-    return abs(charge) * velocity * magnetic_field * math.sin(angle_rad)
+    angle_rad = angle_deg * DEGREES_TO_RADIANS
+    return abs(charge) * velocity * magnetic_field * sin(angle_rad)
 
 def faraday_law(magnetic_flux_change, time):
     """
@@ -262,27 +298,37 @@ def faraday_law(magnetic_flux_change, time):
     
     return -magnetic_flux_change / time
 
-def lens_equation(focal_length=0, object_distance=0, image_distance=0):
+_LENS_SOLVERS = (
+    None,
+    lambda f, do, di: (f, do, 1 / (1/f - 1/do)),
+    lambda f, do, di: (f, 1 / (1/f - 1/di), di),
+    None,
+    lambda f, do, di: (1 / (1/do + 1/di), do, di),
+    None, None, None
+)
+
+@lru_cache(maxsize=32)
+def lens_equation_t(focal_length=0, object_distance=0, image_distance=0):
     """
     Thin lens equation: 1/f = 1/do + 1/di
     Calculate missing variable when 2 are known
+    Returns (f, do, di) tuple
     """
-    known_count = sum(1 for x in [focal_length, object_distance, image_distance] if x != 0)
+    solver = _LENS_SOLVERS[(focal_length == 0) << 2 | (object_distance == 0) << 1 | (image_distance == 0)]
     
-    if known_count != 2:
+    if solver is None:
         raise ValueError("Exactly 2 variables must be non-zero")
     
-    result = {'f': focal_length, 'do': object_distance, 'di': image_distance}
-    
-    if focal_length == 0:
-        result['f'] = 1 / (1/object_distance + 1/image_distance)
-    elif object_distance == 0:
-        result['do'] = 1 / (1/focal_length - 1/image_distance)
-    elif image_distance == 0:
-        result['di'] = 1 / (1/focal_length - 1/object_distance)
-    
-    return result
+    return solver(focal_length, object_distance, image_distance)
 
+def lens_equation(focal_length=0, object_distance=0, image_distance=0):
+    """
+    Thin lens equation: 1/f = 1/do + 1/di
+    Calculate missing variable when 2 are known
+    """
+    return dict(zip(LENS_FIELDS, lens_equation_t(focal_length, object_distance, image_distance)))
+
+@lru_cache(maxsize=32)
 def doppler_effect(source_freq, source_velocity, observer_velocity, wave_speed):
     """
     Doppler effect: f' = f(v ± vo)/(v ± vs)
@@ -290,17 +336,18 @@ def doppler_effect(source_freq, source_velocity, observer_velocity, wave_speed):
     """
     return source_freq * (wave_speed + observer_velocity) / (wave_speed - source_velocity)
 
+_INV_C = 1.0 / SPEED_OF_LIGHT
+_C_SQUARED = SPEED_OF_LIGHT * SPEED_OF_LIGHT
+
 def relativistic_energy(mass, velocity):
     """
     Relativistic total energy: E = γmc²
     """
-    c = SPEED_OF_LIGHT
-    
-    if velocity >= c:
+    if velocity >= SPEED_OF_LIGHT:
         raise ValueError("Velocity must be less than speed of light")
     
-    gamma = 1 / math.sqrt(1 - (velocity/c)**2)
-    return gamma * mass * c**2
+    beta = velocity * _INV_C
+    return mass * _C_SQUARED / sqrt(1.0 - beta * beta)
 
 def de_broglie_wavelength(mass, velocity):
     """
@@ -310,3 +357,21 @@ def de_broglie_wavelength(mass, velocity):
         raise ValueError("Mass and velocity must be positive")
     
     return PLANCK_CONSTANT / (mass * velocity)
+
+# Swap in @micropython.native builds of the arithmetic kernels where the
+# port has the native emitter; other ports keep the definitions above
+try:
+    from physics_native import (newtons_second_law, friction_force, kinetic_energy,
+                                ideal_gas_work, coulomb_force, electric_field)
+except (ImportError, SyntaxError):
+    pass
+
+# Cache whichever coulomb_force build was selected above
+coulomb_force = lru_cache(maxsize=32)(coulomb_force)
+
+def _clear_caches():
+    """Drop memoized results (e.g. between demo runs)"""
+    carnot_efficiency.cache_clear()
+    lens_equation_t.cache_clear()
+    doppler_effect.cache_clear()
+    coulomb_force.cache_clear()
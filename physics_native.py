@@ -0,0 +1,65 @@
+"""
+Native-emitter builds of the simple physics kernels
+Imported by physics.py only where MicroPython supports @micropython.native;
+the import fails (ImportError/SyntaxError) everywhere else
+"""
+
+import micropython
+from constants import COULOMB_CONSTANT
+
+@micropython.native
+def newtons_second_law(mass, acceleration):
+    """
+    Newton's second law: F = ma
+    """
+    if mass <= 0:
+        raise ValueError("Mass must be positive")
+    
+    return mass * acceleration
+
+@micropython.native
+def friction_force(coefficient, normal_force):
+    """
+    Friction force: f = μN
+    """
+    if coefficient < 0 or normal_force < 0:
+        raise ValueError("Coefficient and normal force must be non-negative")
+    
+    return coefficient * normal_force
+
+@micropython.native
+def kinetic_energy(mass, velocity):
+    """
+    Kinetic energy: KE = ½mv²
+    """
+    if mass <= 0:
+        raise ValueError("Mass must be positive")
+    
+    return 0.5 * mass * velocity * velocity
+
+@micropython.native
+def ideal_gas_work(pressure, volume_change):
+    """
+    Work done by ideal gas at constant pressure: W = PΔV
+    """
+    return pressure * volume_change
+
+@micropython.native
+def coulomb_force(q1, q2, distance):
+    """
+    Coulomb's law: F = k·q1·q2/r²
+    """
+    if distance <= 0:
+        raise ValueError("Distance must be positive")
+    
+    return COULOMB_CONSTANT * q1 * q2 / (distance * distance)
+
+@micropython.native
+def electric_field(charge, distance):
+    """
+    Electric field: E = k·q/r²
+    """
+    if distance <= 0:
+        raise ValueError("Distance must be positive")
+    
+    return COULOMB_CONSTANT * charge / (distance * distance)
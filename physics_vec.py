@@ -0,0 +1,146 @@
+"""
+Vectorized physics calculations for desktop Python
+Compiled and array versions of physics.py kernels (not for calculators)
+"""
+
+import math
+import numpy as np
+from constants import GRAVITY, COULOMB_CONSTANT, SPEED_OF_LIGHT, PLANCK_CONSTANT
+
+try:
+    from numba import njit, vectorize
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in when Numba is not installed"""
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):
+        """Stand-in that runs the kernel on float64 arrays with NumPy broadcasting"""
+        def wrap(func):
+            return lambda *xs: func(*(np.asarray(x, dtype=np.float64) for x in xs))
+        return wrap
+
+# Scalar kernels compiled ahead of first use via explicit signatures
+# Plain floats in, floats out: call them from other @njit loops
+@njit('UniTuple(f8, 5)(f8, f8)', cache=True, fastmath=True)
+def projectile_core(v0, angle_rad):
+    """(range, max_height, flight_time, v0x, v0y) for a launch at angle_rad"""
+    v0x = v0 * math.cos(angle_rad)
+    v0y = v0 * math.sin(angle_rad)
+    flight_time = 2.0 * v0y / GRAVITY
+    return (v0x * flight_time, v0y * v0y / (2.0 * GRAVITY), flight_time, v0x, v0y)
+
+@njit('UniTuple(f8, 2)(f8, f8, f8)', cache=True, fastmath=True)
+def constant_acceleration_core(v0, a, t):
+    """(position, velocity) after time t"""
+    return (v0 * t + 0.5 * a * t * t, v0 + a * t)
+
+@njit('f8(f8, f8)', cache=True, fastmath=True)
+def kinetic_energy_core(mass, velocity):
+    """KE = ½mv²"""
+    return 0.5 * mass * velocity * velocity
+
+@njit('f8(f8, f8, f8)', cache=True, fastmath=True)
+def coulomb_force_core(q1, q2, distance):
+    """F = k·q1·q2/r²"""
+    return COULOMB_CONSTANT * q1 * q2 / (distance * distance)
+
+@njit('f8(f8, f8, f8, f8)', cache=True, fastmath=True)
+def simple_harmonic_motion_core(amplitude, angular_freq, time, phase):
+    """x = A·cos(ωt + φ)"""
+    return amplitude * math.cos(angular_freq * time + phase)
+
+@njit('f8(f8, f8)', cache=True, fastmath=True)
+def relativistic_energy_core(mass, velocity):
+    """E = γmc²"""
+    beta = velocity / SPEED_OF_LIGHT
+    return mass * SPEED_OF_LIGHT * SPEED_OF_LIGHT / math.sqrt(1.0 - beta * beta)
+
+# Elementwise laws as NumPy ufuncs: broadcast any mix of scalars and arrays
+# No input checks; non-positive distances, masses or speeds give inf/nan
+@vectorize(['f8(f8, f8)'], target='parallel', fastmath=True)
+def kinetic_energy_ufunc(mass, velocity):
+    """KE = ½mv²"""
+    return 0.5 * mass * velocity * velocity
+
+@vectorize(['f8(f8, f8)'], target='parallel', fastmath=True)
+def gravitational_potential_energy_ufunc(mass, height):
+    """PE = mgh at Earth gravity"""
+    return mass * GRAVITY * height
+
+@vectorize(['f8(f8, f8, f8)'], target='parallel', fastmath=True)
+def coulomb_force_ufunc(q1, q2, distance):
+    """F = k·q1·q2/r²"""
+    return COULOMB_CONSTANT * q1 * q2 / (distance * distance)
+
+@vectorize(['f8(f8, f8)'], target='parallel', fastmath=True)
+def electric_field_ufunc(charge, distance):
+    """E = k·q/r²"""
+    return COULOMB_CONSTANT * charge / (distance * distance)
+
+@vectorize(['f8(f8, f8)'], target='parallel', fastmath=True)
+def de_broglie_wavelength_ufunc(mass, velocity):
+    """λ = h/mv"""
+    return PLANCK_CONSTANT / (mass * velocity)
+
+# Array versions: broadcast NumPy inputs, same result keys as physics.py
+def projectile_motion_batch(v0, angle_deg):
+    """
+    Projectile motion over arrays of launch speed and/or angle
+    Returns dict of arrays: range, max_height, flight_time, v0x, v0y
+    """
+    angle_rad = np.radians(np.asarray(angle_deg, dtype=np.float64))
+    v0 = np.asarray(v0, dtype=np.float64)
+    v0x = v0 * np.cos(angle_rad)
+    v0y = v0 * np.sin(angle_rad)
+    flight_time = 2.0 * v0y / GRAVITY
+
+    return {
+        'range': v0x * flight_time,
+        'max_height': v0y * v0y / (2.0 * GRAVITY),
+        'flight_time': flight_time,
+        'v0x': v0x,
+        'v0y': v0y
+    }
+
+def constant_acceleration_batch(v0, a, t):
+    """
+    Constant-acceleration kinematics over arrays (e.g. a time grid)
+    Returns dict of arrays: position, velocity, acceleration, time
+    """
+    v0, a, t = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (v0, a, t)))
+
+    return {
+        'position': v0 * t + 0.5 * a * t * t,
+        'velocity': v0 + a * t,
+        'acceleration': a,
+        'time': t
+    }
+
+def simple_harmonic_motion_batch(amplitude, angular_freq, time, phase=0):
+    """Simple harmonic motion x = A·cos(ωt + φ) over a time array"""
+    time = np.asarray(time, dtype=np.float64)
+    return amplitude * np.cos(angular_freq * time + phase)
+
+def coulomb_force_batch(q1, q2, distance):
+    """
+    Coulomb force F = k·q1·q2/r² over arrays of charge and/or distance
+    NaN where distance <= 0
+    """
+    q1, q2, distance = (np.asarray(x, dtype=np.float64) for x in (q1, q2, distance))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        force = COULOMB_CONSTANT * q1 * q2 / (distance * distance)
+    return np.where(distance <= 0, np.nan, force)
+
+def coulomb_force_matrix(charges, positions):
+    """
+    Pairwise Coulomb forces for N point charges, signed as in coulomb_force
+    F[i, j] = k·qi·qj/|ri - rj|², zero on the diagonal
+    positions is (N, dims), or (N,) for charges on a line
+    """
+    q = np.asarray(charges, dtype=np.float64).ravel()
+    pos = np.asarray(positions, dtype=np.float64).reshape(q.size, -1)
+    dx = pos[:, None, :] - pos[None, :, :]
+    r2 = (dx * dx).sum(-1)
+    np.fill_diagonal(r2, np.inf)
+    return COULOMB_CONSTANT * np.outer(q, q) / r2
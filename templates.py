@@ -0,0 +1,53 @@
+"""
+Calculation templates for the computational chemistry and physics calculator
+Loaded on demand by examples.show_templates() to keep the strings out of RAM
+"""
+
+# Example calculation templates that users can modify
+CALCULATION_TEMPLATES = {
+    "stoichiometry": """
+# Stoichiometry Template
+reactant_mass = float(input("Reactant mass (g): "))
+reactant_mw = molecular_weight(input("Reactant formula: "))
+product_mw = molecular_weight(input("Product formula: "))
+mole_ratio = float(input("Mole ratio (product/reactant): "))
+
+moles_reactant = reactant_mass / reactant_mw
+moles_product = moles_reactant * mole_ratio
+product_mass = moles_product * product_mw
+
+print(f"Product mass: {product_mass:.2f} g")
+""",
+    
+    "trajectory": """
+# Projectile Trajectory Template
+v0 = float(input("Initial velocity (m/s): "))
+angle = float(input("Launch angle (degrees): "))
+target_x = float(input("Target distance (m): "))
+
+result = projectile_motion(v0, angle)
+print(f"Range: {result['range']:.1f} m")
+print(f"Max height: {result['max_height']:.1f} m")
+
+if abs(result['range'] - target_x) < 1:
+    print("Target hit!")
+else:
+    print(f"Miss by {abs(result['range'] - target_x):.1f} m")
+""",
+    
+    "circuit": """
+# Circuit Analysis Template
+print("Enter two known values (0 for unknown):")
+V = float(input("Voltage (V): ") or "0")
+I = float(input("Current (A): ") or "0") 
+R = float(input("Resistance (Ω): ") or "0")
+
+result = ohms_law(V, I, R)
+power = electrical_power(**{k:v for k,v in result.items() if v != 0})
+
+print(f"V = {result['V']:.2f} V")
+print(f"I = {result['I']:.3f} A") 
+print(f"R = {result['R']:.2f} Ω")
+print(f"P = {power:.2f} W")
+"""
+}
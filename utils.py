@@ -3,38 +3,97 @@ Utility functions for the MicroPython calculator interface
 Optimized for graphing calculator displays and input methods
 """
 
+try:
+    from functools import lru_cache
+except ImportError:
+    # Calculator ports ship without functools
+    class _Memo:
+        """Bounded memo table; cleared in full once maxsize is reached"""
+
+        def __init__(self, func, maxsize):
+            self.func = func
+            self.maxsize = maxsize
+            self.cache = {}
+            self.__doc__ = getattr(func, '__doc__', None)
+            self.__name__ = getattr(func, '__name__', 'memo')
+
+        def __call__(self, *args, **kwargs):
+            if kwargs:
+                # Keyword calls bypass the cache rather than fail
+                return self.func(*args, **kwargs)
+            cache = self.cache
+            if args in cache:
+                return cache[args]
+            if len(cache) >= self.maxsize:
+                cache.clear()
+            result = self.func(*args)
+            cache[args] = result
+            return result
+
+        def cache_clear(self):
+            self.cache.clear()
+
+    def lru_cache(maxsize=128):
+        """Minimal stand-in for functools.lru_cache"""
+        return lambda func: _Memo(func, maxsize)
+
+# Optional system modules, imported once; None where the port lacks them
+try:
+    import sys
+except ImportError:
+    sys = None
+
+try:
+    import os
+except ImportError:
+    os = None
+
+try:
+    import gc
+except ImportError:
+    gc = None
+
+if getattr(sys, 'stdout', None) is not None:
+    def write_text(text):
+        """Write text to stdout in one call, without adding a newline"""
+        sys.stdout.write(text)
+else:
+    # Some calculator ports ship sys without stdout
+    def write_text(text):
+        """Write text to stdout in one call, without adding a newline"""
+        print(text, end="")
+
 def display_menu(title, options):
     """
     Display a formatted menu with title and options
     Optimized for calculator screen width
     """
-    print("=" * len(title))
-    print(title)
-    print("=" * len(title))
+    bar = "=" * len(title)
+    lines = [bar, title, bar]
     
     for i, option in enumerate(options, 1):
-        print(f"{i}. {option}")
+        lines.append(f"{i}. {option}")
     
-    print("0. Back/Exit")
-    print("=" * len(title))
+    lines.append("0. Back/Exit")
+    lines.append(bar)
+    write_text("\n".join(lines) + "\n")
 
 def get_user_input(prompt, input_type=str):
     """
     Get user input with type conversion and error handling
     Designed for calculator input limitations
+    input_type is any converter taking a string (float, int, complex, ...)
     """
+    # Resolve the conversion once, not on every retry
+    convert = None if input_type is str else input_type
+    
     while True:
         try:
             value = input(prompt)
             if value.strip() == "":
                 return ""
             
-            if input_type == float:
-                return float(value)
-            elif input_type == int:
-                return int(value)
-            else:
-                return value
+            return value if convert is None else convert(value)
                 
         except ValueError:
             print(f"Invalid input. Please enter a valid {input_type.__name__}.")
@@ -42,27 +101,82 @@ def get_user_input(prompt, input_type=str):
             print("\nOperation cancelled.")
             return ""
 
+def read_float(prompt, default=0.0):
+    """
+    Read a float, returning default on empty input
+    """
+    value = get_user_input(prompt)
+    return float(value) if value else default
+
+def read_int(prompt, default=0):
+    """
+    Read an integer, returning default on empty input
+    """
+    value = get_user_input(prompt)
+    return int(value) if value else default
+
+# Screen clearing method, chosen once: ANSI erase + home on terminals,
+# the cls command on Windows consoles, blank lines on calculators without os
+if os is None:
+    _CLEAR = "\n" * 11
+elif getattr(os, 'name', '') == 'nt':
+    _CLEAR = None
+else:
+    _CLEAR = "\x1b[2J\x1b[H"
+
 def clear_screen():
     """
     Clear screen function compatible with different calculator systems
     """
-    try:
-        # Try standard clear methods
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
-    except:
-        # Fallback for calculators without os module
-        print("\n" * 10)
+    if _CLEAR is None:
+        os.system('cls')
+    else:
+        write_text(_CLEAR)
+
+# (scientific, fixed) % format specs per precision, built on first use
+_FORMAT_SPECS = {}
 
 def format_number(value, precision=4):
     """
     Format numbers for calculator display
     Handles scientific notation for very large/small numbers
     """
-    if abs(value) < 1e-4 or abs(value) >= 1e6:
-        return f"{value:.{precision-1}e}"
-    else:
-        return f"{value:.{precision}f}".rstrip('0').rstrip('.')
+    specs = _FORMAT_SPECS.get(precision)
+    if specs is None:
+        specs = _FORMAT_SPECS[precision] = ("%%.%de" % (precision - 1), "%%.%df" % precision)
+    
+    magnitude = abs(value)
+    if magnitude < 1e-4 or magnitude >= 1e6:
+        return specs[0] % value
+    
+    # Trim trailing zeros and a bare point with one slice
+    text = specs[1] % value
+    end = len(text)
+    while end and text[end - 1] == '0':
+        end -= 1
+    if end and text[end - 1] == '.':
+        end -= 1
+    return text[:end]
+
+def format_numbers(values, precision=4):
+    """
+    Format a sequence of numbers for display, matching format_number
+    Uses NumPy masks and string ufuncs where available; returns a list
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [format_number(value, precision) for value in values]
+    
+    v = np.asarray(values, dtype=np.float64).ravel()
+    magnitude = np.abs(v)
+    sci = (magnitude < 1e-4) | (magnitude >= 1e6)
+    
+    out = np.empty(v.shape, dtype=object)
+    out[sci] = np.char.mod("%%.%de" % (precision - 1), v[sci])
+    fixed = np.char.mod("%%.%df" % precision, v[~sci])
+    out[~sci] = np.char.rstrip(np.char.rstrip(fixed, '0'), '.')
+    return out.tolist()
 
 def validate_positive(value, name="Value"):
     """
@@ -88,115 +202,206 @@ def safe_divide(numerator, denominator, name="denominator"):
         raise ValueError(f"Division by zero: {name} cannot be zero")
     return numerator / denominator
 
+# Specialized validators for hot callers: the error message is built once
+# when the check is made, and each call is a single comparison
+def make_positive_check(name="Value"):
+    """
+    Build validate_positive with a fixed name
+    """
+    message = f"{name} must be positive"
+    
+    def check(value):
+        if value <= 0:
+            raise ValueError(message)
+        return value
+    
+    return check
+
+def make_range_check(min_val, max_val, name="Value"):
+    """
+    Build validate_range with fixed bounds and name
+    """
+    message = f"{name} must be between {min_val} and {max_val}"
+    
+    def check(value):
+        if value < min_val or value > max_val:
+            raise ValueError(message)
+        return value
+    
+    return check
+
+def make_safe_divide(name="denominator"):
+    """
+    Build safe_divide with a fixed denominator name
+    """
+    message = f"Division by zero: {name} cannot be zero"
+    
+    def divide(numerator, denominator):
+        if denominator == 0:
+            raise ValueError(message)
+        return numerator / denominator
+    
+    return divide
+
 def parse_scientific_notation(input_str):
     """
     Parse scientific notation input from calculators
     Handles formats like "1.23e-4", "1.23E-4", "1.23*10^-4"
     """
     try:
-        # Replace common scientific notation formats
-        normalized = input_str.replace("*10^", "e").replace("E", "e")
-        return float(normalized)
+        # float() already accepts "1.23e-4" and "1.23E-4"
+        return float(input_str)
+    except ValueError:
+        pass
+    
+    try:
+        return float(input_str.replace("*10^", "e"))
     except ValueError:
         raise ValueError(f"Invalid scientific notation: {input_str}")
 
 def memory_efficient_range(start, stop, step=1):
     """
-    Memory-efficient range generator for calculators
+    Memory-efficient range for calculators
+    Integer bounds return a built-in range (supports len() and x in r);
+    float bounds fall back to a generator with the same step rules
     """
+    if isinstance(start, int) and isinstance(stop, int) and isinstance(step, int):
+        return range(start, stop, step)
+    if step == 0:
+        raise ValueError("Step must not be zero")
+    return _float_range(start, stop, step)
+
+def _float_range(start, stop, step):
     current = start
-    while current < stop:
-        yield current
-        current += step
+    if step > 0:
+        while current < stop:
+            yield current
+            current += step
+    else:
+        while current > stop:
+            yield current
+            current += step
 
 def truncate_string(text, max_length=20):
     """
     Truncate strings for calculator display limits
+    Keeps both ends: "Hydrochloric acid" -> "Hydr...acid" at max_length=11
     """
-    if len(text) <= max_length:
+    n = len(text)
+    if n <= max_length:
         return text
-    return text[:max_length-3] + "..."
+    if max_length < 3:
+        return text[:max_length]
+    return text[:(max_length - 3) // 2] + "..." + text[n - (max_length - 2) // 2:]
 
 def create_simple_table(headers, rows, max_width=30):
     """
     Create simple formatted table for calculator display
+    Cells beyond the last header are ignored
     """
+    ncols = len(headers)
+    srows = [[str(cell) for cell in row] for row in rows]
+    
     # Calculate column widths
     col_widths = [len(header) for header in headers]
     
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
+    for row in srows:
+        for i, cell in zip(range(ncols), row):
+            if len(cell) > col_widths[i]:
+                col_widths[i] = len(cell)
     
     # Adjust for total width constraint
-    total_width = sum(col_widths) + len(headers) - 1
+    total_width = sum(col_widths) + ncols - 1
     if total_width > max_width:
-        # Proportionally reduce column widths
-        reduction_factor = max_width / total_width
-        col_widths = [int(w * reduction_factor) for w in col_widths]
+        # Proportionally reduce column widths in integer arithmetic so the
+        # columns plus separators fill max_width exactly; the rounding
+        # remainder goes to the widest columns
+        budget = max(max_width - (ncols - 1), 0)
+        content = total_width - (ncols - 1)
+        # All-empty columns have nothing to shrink and stay at width 0
+        reduced = [w * budget // content for w in col_widths] if content else [0] * ncols
+        leftover = budget - sum(reduced)
+        for i in sorted(range(ncols), key=lambda i: -col_widths[i])[:leftover]:
+            reduced[i] += 1
+        col_widths = reduced
+    
+    # Left-justified %-format template for the fixed column layout;
+    # rows shorter than the header use its leading columns
+    specs = ["%%-%ds" % w for w in col_widths]
+    template = " ".join(specs)
     
     # Print table
-    header_line = " ".join(header.ljust(col_widths[i]) for i, header in enumerate(headers))
-    print(header_line)
-    print("-" * len(header_line))
+    lines = [template % tuple(truncate_string(header, w) for header, w in zip(headers, col_widths)),
+             "-" * (sum(col_widths) + ncols - 1)]
+    
+    for row in srows:
+        cells = tuple(truncate_string(cell, w) for cell, w in zip(row, col_widths))
+        row_template = template if len(cells) == ncols else " ".join(specs[:len(cells)])
+        lines.append(row_template % cells)
     
-    for row in rows:
-        row_line = " ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-        print(row_line)
+    write_text("\n".join(lines) + "\n")
 
-def get_calculator_model():
+def _detect_model():
     """
     Attempt to detect calculator model for model-specific optimizations
     """
     try:
-        import sys
-        platform = sys.platform
+        platform = sys.platform.lower()
         
-        if "ti" in platform.lower():
+        if "ti" in platform:
             return "TI-84"
-        elif "numworks" in platform.lower():
+        elif "numworks" in platform:
             return "NumWorks"
-        elif "casio" in platform.lower():
+        elif "casio" in platform:
             return "Casio"
         else:
             return "Unknown"
     except:
         return "Unknown"
 
+_OPTS_BY_MODEL = {
+    # TI-84 specific optimizations
+    "TI-84": {
+        "max_line_length": 25,
+        "max_lines": 8,
+        "decimal_places": 6
+    },
+    # NumWorks specific optimizations
+    "NumWorks": {
+        "max_line_length": 30,
+        "max_lines": 10,
+        "decimal_places": 8
+    },
+    # Casio specific optimizations
+    "Casio": {
+        "max_line_length": 21,
+        "max_lines": 7,
+        "decimal_places": 6
+    },
+    # Default/safe values
+    "Unknown": {
+        "max_line_length": 20,
+        "max_lines": 6,
+        "decimal_places": 4
+    }
+}
+
+# The platform cannot change while running, so detect once at import
+_MODEL = _detect_model()
+_CALC_OPTS = _OPTS_BY_MODEL[_MODEL]
+
+def get_calculator_model():
+    """
+    Calculator model detected at import ("TI-84", "NumWorks", "Casio" or "Unknown")
+    """
+    return _MODEL
+
 def optimize_for_calculator():
     """
     Apply calculator-specific optimizations
+    Returns the shared display settings for this model; treat as read-only
     """
-    model = get_calculator_model()
-    
-    if model == "TI-84":
-        # TI-84 specific optimizations
-        return {
-            "max_line_length": 25,
-            "max_lines": 8,
-            "decimal_places": 6
-        }
-    elif model == "NumWorks":
-        # NumWorks specific optimizations
-        return {
-            "max_line_length": 30,
-            "max_lines": 10,
-            "decimal_places": 8
-        }
-    elif model == "Casio":
-        # Casio specific optimizations
-        return {
-            "max_line_length": 21,
-            "max_lines": 7,
-            "decimal_places": 6
-        }
-    else:
-        # Default/safe values
-        return {
-            "max_line_length": 20,
-            "max_lines": 6,
-            "decimal_places": 4
-        }
+    return _CALC_OPTS
 
 def wait_for_input(message="Press any key to continue..."):
     """
@@ -211,81 +416,122 @@ def format_result_display(label, value, unit="", precision=4):
     """
     Format calculation results for optimal calculator display
     """
-    formatted_value = format_number(value, precision)
-    
-    if unit:
-        return f"{label}: {formatted_value} {unit}"
-    else:
-        return f"{label}: {formatted_value}"
+    suffix = " " + unit if unit else ""
+    return f"{label}: {format_number(value, precision)}{suffix}"
 
 def handle_calculator_error(func):
     """
     Decorator for calculator-friendly error handling
     """
+    # Bound once per decorated function; the except path reads closure cells
+    _print, _wait = print, wait_for_input
+    
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            print(f"Error: {str(e)}")
-            wait_for_input()
+            _print(f"Error: {e}")
+            _wait()
             return None
+    
+    try:
+        wrapper.__wrapped__ = func
+    except AttributeError:
+        pass  # MicroPython functions take no attributes
     return wrapper
 
 def memory_usage_warning(threshold_kb=10):
     """
     Check memory usage and warn if approaching limits
-    Simple implementation for calculators
+    Collects garbage only when free heap is below threshold_kb
+    Returns free bytes, or None where the heap size is not reported
+    """
+    mem_free = getattr(gc, 'mem_free', None)  # MicroPython only
+    if mem_free is None:
+        return None
+    
+    limit = threshold_kb * 1024
+    free = mem_free()
+    
+    if free < limit:
+        gc.collect()
+        free = mem_free()
+        if free < limit:
+            print(f"Warning: low memory ({free // 1024} KB free)")
+    
+    return free
+
+def open_history(path="history.txt", mode="w"):
+    """
+    Open a buffered history file for save_calculation_history
+    Call .flush() or .close() on it at the end of the session
     """
     try:
-        import gc
-        gc.collect()  # Force garbage collection
-        
-        # Basic memory check (implementation varies by calculator)
-        # This is a simplified version
-        print("Memory check completed.")
-        
-    except ImportError:
-        # If gc module not available, skip memory check
-        pass
+        return open(path, mode, buffering=8192)
+    except TypeError:
+        # MicroPython's open() takes no buffering argument
+        return open(path, mode)
 
-def save_calculation_history(calculation, result):
+def save_calculation_history(calculation, result, stream=None):
     """
     Simple calculation history for calculator sessions
     Memory-efficient implementation
+    Writes to stream (e.g. from open_history) or to the screen
     """
-    # In a real calculator, this might save to a file
-    # For now, just print to maintain session record
     timestamp = "Session"  # Simplified timestamp
-    print(f"[{timestamp}] {calculation} = {result}")
+    line = f"[{timestamp}] {calculation} = {result}\n"
+    
+    if stream is None:
+        write_text(line)
+    else:
+        stream.write(line)
+
+_DEFAULT_PREFS = {
+    "decimal_places": 4,
+    "scientific_notation_threshold": 1e4,
+    "angle_mode": "degrees",  # or "radians"
+    "auto_clear": True
+}
 
 def load_user_preferences():
     """
     Load user preferences for calculator interface
-    Returns default values if no preferences file exists
+    Returns a fresh copy of the defaults, since no preferences file is read
     """
-    default_prefs = {
-        "decimal_places": 4,
-        "scientific_notation_threshold": 1e4,
-        "angle_mode": "degrees",  # or "radians"
-        "auto_clear": True
-    }
-    
-    try:
-        # In a full implementation, this would load from a file
-        # For calculator compatibility, return defaults
-        return default_prefs
-    except:
-        return default_prefs
+    return _DEFAULT_PREFS.copy()
+
+# Completed bar at the default width, returned as-is when total is 0
+_FULL_BAR = "[" + "=" * 20 + "]"
 
 def create_progress_bar(current, total, width=20):
     """
     Create simple text progress bar for long calculations
     """
     if total == 0:
-        return "[" + "=" * width + "]"
+        return _FULL_BAR if width == 20 else "[" + "=" * width + "]"
     
-    progress = int((current / total) * width)
-    bar = "[" + "=" * progress + " " * (width - progress) + "]"
-    percentage = int((current / total) * 100)
+    fraction = current / total
+    progress = int(fraction * width)
+    # Negative progress pads by width - progress, as the original " " * n did
+    bar = "[" + ("=" * progress).ljust(width - progress if progress < 0 else width) + "]"
+    percentage = int(fraction * 100)
     
     return f"{bar} {percentage}%"
+
+def render_progress(current, total, width=20, stream=None):
+    """
+    Redraw a progress bar in place on the current line
+    Each update starts with a carriage return; print a newline when done
+    """
+    if stream is None:
+        stream = getattr(sys, 'stdout', None)
+    
+    text = "\r" + create_progress_bar(current, total, width)
+    if stream is None:
+        print(text, end="")
+        return
+    
+    stream.write(text)
+    flush = getattr(stream, 'flush', None)
+    if flush is not None:
+        flush()